@@ -4,19 +4,30 @@ An MCP server that provides tools for managing Google Tasks,
 including creating tasks, listing tasks, completing tasks, and adding links.
 """
 
+import argparse
+import asyncio
+import functools
 import logging
 import os
-import re
+import random
 import sys
+import tempfile
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
 from typing import Optional
 
 from fastmcp import FastMCP
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+import google_auth_httplib2
+import httplib2
+import orjson
+from pydantic import BaseModel, ConfigDict, Field
 
 # ---------------------------------------------------------------------------
 # Logging – all output goes to stderr so stdout stays clean for MCP protocol
@@ -35,8 +46,14 @@ SCOPES = ["https://www.googleapis.com/auth/tasks"]
 _PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 CREDENTIALS_PATH = os.path.join(_PROJECT_ROOT, "credentials.json")
 TOKEN_PATH = os.path.join(_PROJECT_ROOT, "token.json")
-DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-URL_RE = re.compile(r"^https?://\S+$")
+HTTP_TIMEOUT = 30  # seconds
+_UTC = timezone.utc
+
+# Partial-response selectors: ask Google for only the fields the sanitizers
+# keep, so unused ones (etag, selfLink, links, ...) are never sent.
+TASK_FIELDS = "id,title,notes,due,status,parent,updated,completed"
+TASK_LIST_FIELDS = f"items({TASK_FIELDS})"
+TASKLIST_LIST_FIELDS = "items(id,title)"
 
 # ---------------------------------------------------------------------------
 # Custom Exceptions
@@ -62,22 +79,44 @@ class APIError(GTasksError):
 # Validation Helpers
 # ---------------------------------------------------------------------------
 
-def validate_date_format(date_str: str) -> None:
-    """Validate that a date string matches YYYY-MM-DD format."""
-    if not DATE_RE.match(date_str):
+@functools.lru_cache(maxsize=256)
+def _validate_and_format_date(date_str: str) -> str:
+    """Validate a YYYY-MM-DD date string and return it as a due timestamp.
+
+    Results are memoized, so repeated dates (e.g. when bulk-creating tasks)
+    skip the parse entirely.
+    """
+    if (
+        len(date_str) != 10
+        or date_str[4] != "-"
+        or date_str[7] != "-"
+        or not date_str.isascii()
+        or not (
+            date_str[:4].isdigit()
+            and date_str[5:7].isdigit()
+            and date_str[8:].isdigit()
+        )
+    ):
         raise ValidationError(
             f"Invalid date format: '{date_str}'. Expected YYYY-MM-DD."
         )
     # Also validate it's a real date
     try:
-        datetime.strptime(date_str, "%Y-%m-%d")
+        datetime(int(date_str[:4]), int(date_str[5:7]), int(date_str[8:]))
     except ValueError as exc:
         raise ValidationError(f"Invalid date: '{date_str}'. {exc}") from exc
+    return date_str + "T00:00:00.000Z"
 
 
 def validate_url_format(url: str) -> None:
     """Validate that a URL starts with http:// or https://."""
-    if not URL_RE.match(url):
+    if url.startswith("https://"):
+        rest = url[8:]
+    elif url.startswith("http://"):
+        rest = url[7:]
+    else:
+        rest = ""
+    if not rest or any(c.isspace() for c in rest):
         raise ValidationError(
             f"Invalid URL format: '{url}'. URL must start with http:// or https://."
         )
@@ -87,25 +126,63 @@ def validate_url_format(url: str) -> None:
 # Error Handling Helpers
 # ---------------------------------------------------------------------------
 
+def _auth_error(context: str) -> GTasksError:
+    return AuthenticationError(
+        f"Authentication failed during {context}. "
+        "Please re-authenticate with Google Tasks."
+    )
+
+
+# Google reports some quota errors as 403 rather than 429; the reason in the
+# error body tells them apart from permission failures.
+_RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+
+def _error_reason(error: HttpError) -> Optional[str]:
+    """Return the first 'reason' from a Google API error body, if any."""
+    try:
+        data = orjson.loads(error.content)
+    except (orjson.JSONDecodeError, TypeError):
+        return None
+    details = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(details, dict):
+        return None
+    for entry in (details.get("errors") or []) + (details.get("details") or []):
+        if isinstance(entry, dict) and entry.get("reason"):
+            return entry["reason"]
+    return None
+
+
+def is_rate_limited(error: HttpError) -> bool:
+    """Return whether an HttpError is a 429 or a rate-limit 403."""
+    status = error.resp.status
+    return status == 429 or (
+        status == 403 and _error_reason(error) in _RATE_LIMIT_REASONS
+    )
+
+
+# HTTP status -> factory for the GTasksError raised by handle_api_error
+_STATUS_ERRORS = {
+    401: _auth_error,
+    403: _auth_error,
+    404: lambda context: APIError(f"Resource not found during {context}."),
+    429: lambda context: APIError(
+        f"Rate limit exceeded during {context}. Try again later."
+    ),
+}
+
+
 def handle_api_error(error: HttpError, context: str) -> None:
     """Convert Google API HttpError into an appropriate GTasksError.
 
     Raises:
-        AuthenticationError: For 401/403 responses.
+        AuthenticationError: For 401/403 responses, except rate-limit 403s.
         APIError: For all other HTTP error responses.
     """
-    status = error.resp.status
-    if status in (401, 403):
-        raise AuthenticationError(
-            f"Authentication failed during {context}. "
-            "Please re-authenticate with Google Tasks."
-        ) from error
-    if status == 404:
-        raise APIError(f"Resource not found during {context}.") from error
-    if status == 429:
-        raise APIError(
-            f"Rate limit exceeded during {context}. Try again later."
-        ) from error
+    status = 429 if is_rate_limited(error) else error.resp.status
+    make_error = _STATUS_ERRORS.get(status)
+    if make_error is not None:
+        raise make_error(context) from error
     if status >= 500:
         raise APIError(
             f"Google Tasks API temporarily unavailable during {context}."
@@ -131,12 +208,22 @@ def handle_unexpected_error(error: Exception, operation: str) -> None:
 # Response Sanitization
 # ---------------------------------------------------------------------------
 
-_TASK_FIELDS = {"id", "title", "notes", "due", "status", "parent", "updated", "completed"}
-
-
 def sanitize_task_response(task: dict) -> dict:
     """Return only the relevant fields from a task resource."""
-    result = {k: task[k] for k in _TASK_FIELDS if k in task}
+    get = task.get
+    result = {
+        "id": get("id"),
+        "title": get("title"),
+        "notes": get("notes"),
+        "due": get("due"),
+        "status": get("status"),
+        "parent": get("parent"),
+        "updated": get("updated"),
+        "completed": get("completed"),
+    }
+    # Omit fields the resource didn't carry, as the API does
+    if None in result.values():
+        result = {k: v for k, v in result.items() if v is not None}
     result["is_subtask"] = "parent" in task
     return result
 
@@ -146,30 +233,139 @@ def sanitize_tasklist_response(tasklist: dict) -> dict:
     return {"id": tasklist["id"], "title": tasklist["title"]}
 
 
+# ---------------------------------------------------------------------------
+# Response Parsing
+# ---------------------------------------------------------------------------
+
+class OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson.
+
+    orjson reads the raw bytes directly, skipping the UTF-8 decode and the
+    slower stdlib parser on every execute().
+    """
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Match JsonModel: hand back non-JSON bodies as text
+            if isinstance(content, bytes):
+                content = content.decode("utf-8")
+            return content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# ---------------------------------------------------------------------------
+# Tool Input Models
+# ---------------------------------------------------------------------------
+
+class NewTask(BaseModel):
+    """One task to create with create_tasks."""
+
+    # Reject unknown keys so a typo (e.g. 'due' for 'due_date') fails
+    # validation instead of silently dropping the field.
+    model_config = ConfigDict(extra="forbid")
+
+    title: str = Field(description="Task title (max 1024 characters).")
+    notes: Optional[str] = Field(
+        default=None, description="Optional notes / description for the task."
+    )
+    due_date: Optional[str] = Field(
+        default=None, description="Optional due date in YYYY-MM-DD format."
+    )
+    parent: Optional[str] = Field(
+        default=None,
+        description="Optional parent task ID to create this as a subtask.",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Request Body Helpers
+# ---------------------------------------------------------------------------
+
+def build_task_body(
+    title: str,
+    notes: Optional[str] = None,
+    due_date: Optional[str] = None,
+) -> dict:
+    """Validate task fields and return a task resource body for insert()."""
+    if not title or not title.strip():
+        raise ValidationError("Task title must not be empty.")
+    if len(title) > 1024:
+        raise ValidationError("Task title must be 1024 characters or fewer.")
+    body: dict = {"title": title.strip()}
+    if notes is not None:
+        body["notes"] = notes
+    if due_date is not None:
+        body["due"] = _validate_and_format_date(due_date)
+    return body
+
+
+def build_completion_body(completed: bool) -> dict:
+    """Return a partial task body that sets or clears completion status."""
+    # Clearing "completed" requires an explicit null in a partial update.
+    if completed:
+        now = datetime.now(_UTC)
+        return {
+            "status": "completed",
+            "completed": (
+                f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+                f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}.000Z"
+            ),
+        }
+    return {"status": "needsAction", "completed": None}
+
+
 # ---------------------------------------------------------------------------
 # Authentication
 # ---------------------------------------------------------------------------
 
 _service_cache = None
+_tasks_resource = None
+_tasklists_resource = None
+_creds_cache = None
+_creds_mtime = None
+
+
+def _token_mtime():
+    """Return token.json's modification time, or None if it doesn't exist."""
+    try:
+        return os.stat(TOKEN_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _authorized_http(creds):
+    """Return an AuthorizedHttp over a persistent, non-caching httplib2.Http."""
+    return google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(cache=None, timeout=HTTP_TIMEOUT)
+    )
 
 
 def get_authenticated_service():
     """Build and return an authenticated Google Tasks API service.
 
     On first run, opens a browser for OAuth consent.  On subsequent runs,
-    reuses / refreshes the stored token.
+    reuses / refreshes the stored token.  Parsed credentials are kept in
+    memory; token.json is only re-read once they expire and the file has
+    changed since it was last loaded.
 
     Raises:
         AuthenticationError: If credentials are missing or the flow fails.
     """
-    global _service_cache
-    if _service_cache is not None:
+    global _service_cache, _tasks_resource, _tasklists_resource
+    global _creds_cache, _creds_mtime
+    if _service_cache is not None and not _creds_cache.expired:
         return _service_cache
 
-    creds = None
-    if os.path.exists(TOKEN_PATH):
+    creds = _creds_cache
+    mtime = _token_mtime()
+    if mtime is not None and (creds is None or mtime != _creds_mtime):
         try:
             creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
+            _creds_mtime = mtime
         except Exception:
             logger.warning("Failed to load token.json; will re-authenticate.")
 
@@ -188,6 +384,10 @@ def get_authenticated_service():
                     "Download OAuth client credentials from the Google Cloud Console."
                 )
             try:
+                # Only needed for first-time consent; importing it pulls in
+                # requests-oauthlib and oauthlib, so keep it off startup.
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
                 flow = InstalledAppFlow.from_client_secrets_file(
                     CREDENTIALS_PATH, SCOPES
                 )
@@ -197,17 +397,353 @@ def get_authenticated_service():
                     f"OAuth consent flow failed: {exc}"
                 ) from exc
 
-        # Persist token for future runs
+        # Persist token for future runs.  mkstemp creates the file 0600, and
+        # the rename means readers never see a partial or world-readable
+        # token.
         try:
-            with open(TOKEN_PATH, "w") as token_file:
-                token_file.write(creds.to_json())
-            os.chmod(TOKEN_PATH, 0o600)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=os.path.dirname(TOKEN_PATH), prefix=".token-", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w") as token_file:
+                    token_file.write(creds.to_json())
+                os.replace(tmp_path, TOKEN_PATH)
+            except OSError:
+                os.unlink(tmp_path)
+                raise
+            _creds_mtime = _token_mtime()
         except OSError as exc:
             logger.warning("Could not save token.json: %s", exc)
 
-    service = build("tasks", "v1", credentials=creds)
-    _service_cache = service
-    return service
+    # A refresh updates the cached credentials in place, so the existing
+    # service (and its AuthorizedHttp) keeps working with the new token.
+    if _service_cache is None or creds is not _creds_cache:
+        # Use the discovery document bundled with googleapiclient instead of
+        # fetching it from Google before the first call.
+        service = build(
+            "tasks",
+            "v1",
+            http=_authorized_http(creds),
+            model=OrjsonModel(),
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        # Each collection accessor call synthesizes a new Resource from the
+        # discovery document, so build them once per service.
+        _tasks_resource = service.tasks()
+        _tasklists_resource = service.tasklists()
+        _service_cache = service
+        _creds_cache = creds
+    return _service_cache
+
+
+# Token refresh, token.json I/O and the consent flow all block, so tools
+# run them in a worker thread; the lock keeps concurrent calls from
+# refreshing (or opening a consent flow) more than once.
+_auth_lock = asyncio.Lock()
+
+
+async def get_authenticated_service_async():
+    """Return the authenticated service without blocking the event loop."""
+    if _service_cache is not None and not _creds_cache.expired:
+        return _service_cache
+    async with _auth_lock:
+        return await asyncio.to_thread(get_authenticated_service)
+
+
+async def get_tasks_resource():
+    """Return the cached 'tasks' collection of the authenticated service."""
+    await get_authenticated_service_async()
+    return _tasks_resource
+
+
+async def get_tasklists_resource():
+    """Return the cached 'tasklists' collection of the authenticated service."""
+    await get_authenticated_service_async()
+    return _tasklists_resource
+
+
+# ---------------------------------------------------------------------------
+# Request Execution
+# ---------------------------------------------------------------------------
+
+# httplib2 connections are not thread-safe, so each worker thread keeps its
+# own AuthorizedHttp (and with it a kept-alive connection to Google).
+_http_local = threading.local()
+
+
+def _thread_http():
+    """Return the calling thread's AuthorizedHttp for the current credentials."""
+    http = getattr(_http_local, "http", None)
+    if http is None or http.credentials is not _creds_cache:
+        http = _authorized_http(_creds_cache)
+        _http_local.http = http
+    return http
+
+
+def _execute_in_thread(request):
+    return request.execute(http=_thread_http())
+
+
+# Transient failures are retried here rather than surfacing to the agent,
+# which would otherwise re-invoke the whole tool.  A rate-limit response
+# (429, or 403 with a rate-limit reason) means the request was not
+# processed, so it is always safe to retry; 5xx responses and connection or
+# timeout errors are only retried for idempotent requests (every method
+# except POST), since the write may already have happened.
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 30  # seconds
+_RETRY_IDEMPOTENT = frozenset({500, 502, 503, 504})
+_TRANSPORT_ERRORS = (ConnectionError, TimeoutError, httplib2.ServerNotFoundError)
+
+
+def _is_retryable(error: Exception, idempotent: bool) -> bool:
+    if isinstance(error, HttpError):
+        return is_rate_limited(error) or (
+            idempotent and error.resp.status in _RETRY_IDEMPOTENT
+        )
+    return idempotent and isinstance(error, _TRANSPORT_ERRORS)
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt, honoring Retry-After."""
+    if isinstance(error, HttpError):
+        retry_after = error.resp.get("retry-after")
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+    return min(2**attempt + random.random(), MAX_RETRY_DELAY)
+
+
+def _describe_failure(error: Exception) -> str:
+    if isinstance(error, HttpError):
+        return f"HTTP {error.resp.status}"
+    return type(error).__name__
+
+
+async def execute_request(
+    request,
+    max_retries: int = MAX_RETRIES,
+    idempotent: Optional[bool] = None,
+):
+    """Execute an API (or batch) request without blocking the event loop.
+
+    Rate-limited requests, transient server errors and (for idempotent
+    requests) connection/timeout errors are retried up to max_retries times
+    with exponential backoff before the error is re-raised.  idempotent
+    defaults to whether the request's method is not POST; batch envelopes
+    are always POSTed, so execute_batch passes it explicitly.
+    """
+    if idempotent is None:
+        idempotent = request.method != "POST"
+    attempt = 0
+    while True:
+        try:
+            return await asyncio.to_thread(_execute_in_thread, request)
+        except (HttpError, *_TRANSPORT_ERRORS) as exc:
+            if attempt >= max_retries or not _is_retryable(exc, idempotent):
+                raise
+            delay = _retry_delay(exc, attempt)
+            logger.warning(
+                "Google Tasks API call failed (%s); retrying in %.1fs "
+                "(attempt %d/%d)",
+                _describe_failure(exc),
+                delay,
+                attempt + 1,
+                max_retries,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+# Maximum number of sub-requests Google accepts in one batch call.
+BATCH_LIMIT = 100
+
+
+async def execute_batch(service, requests: list, context: str) -> list[dict]:
+    """Execute API requests via the batch endpoint, BATCH_LIMIT at a time.
+
+    Google rate-limits sub-requests individually, so those failing with an
+    error execute_request would retry (a rate limit, or a 5xx on an
+    idempotent method) are re-submitted in a follow-up batch, with the same
+    backoff and retry limit.
+
+    Returns one entry per request, in order: the sanitized task on success,
+    or a dict with an 'error' message if that sub-request failed.
+    """
+    results: list[dict] = [{} for _ in requests]
+    idempotent = [request.method != "POST" for request in requests]
+
+    def _record_error(index: int, exception: Exception) -> None:
+        try:
+            if isinstance(exception, HttpError):
+                handle_api_error(exception, context)
+            raise GTasksError(f"Unexpected error during {context}: {exception}")
+        except GTasksError as err:
+            results[index] = {"error": str(err)}
+
+    pending = list(range(len(requests)))
+    for attempt in range(MAX_RETRIES + 1):
+        retry: list[int] = []
+        delay = 0.0
+
+        def _collect(request_id, response, exception):
+            nonlocal delay
+            index = int(request_id)
+            if exception is None:
+                results[index] = sanitize_task_response(response)
+            elif (
+                attempt < MAX_RETRIES
+                and _is_retryable(exception, idempotent[index])
+            ):
+                retry.append(index)
+                delay = max(delay, _retry_delay(exception, attempt))
+            else:
+                _record_error(index, exception)
+
+        for start in range(0, len(pending), BATCH_LIMIT):
+            chunk = pending[start:start + BATCH_LIMIT]
+            batch = service.new_batch_http_request(callback=_collect)
+            for index in chunk:
+                batch.add(requests[index], request_id=str(index))
+            try:
+                await execute_request(
+                    batch, idempotent=all(idempotent[i] for i in chunk)
+                )
+            except Exception as exc:
+                # Earlier chunks may already have written; report this
+                # chunk's failure per item rather than discarding their
+                # results.
+                for index in chunk:
+                    if not results[index]:
+                        _record_error(index, exc)
+
+        if not retry:
+            break
+        logger.warning(
+            "%d batched request(s) failed during %s; retrying in %.1fs "
+            "(attempt %d/%d)",
+            len(retry),
+            context,
+            delay,
+            attempt + 1,
+            MAX_RETRIES,
+        )
+        await asyncio.sleep(delay)
+        pending = sorted(retry)
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Response Cache
+# ---------------------------------------------------------------------------
+
+# Read results are reused for a short window: planners commonly call
+# get_lists / list_tasks before every action.  Mutating tools drop every
+# cached list_tasks result.
+CACHE_TTL = 30  # seconds
+CACHE_MAXSIZE = 128
+
+# Keys are (tool, *args).  Invalidation bumps a per-tool generation; a read
+# snapshots it before calling the API and only caches its result if no
+# mutation ran meanwhile, so an in-flight read can't repopulate the cache
+# with pre-mutation data.
+_response_cache: dict[tuple, tuple[float, list]] = {}
+_cache_generations: dict[str, int] = {}
+_response_cache_lock = threading.Lock()
+
+
+def cache_generation(key: tuple) -> int:
+    """Return the current generation of the tool key belongs to."""
+    with _response_cache_lock:
+        return _cache_generations.get(key[0], 0)
+
+
+def _ttl_get(store: dict, key):
+    """Return the live value for key in a TTL store, or None.
+
+    Callers must hold _response_cache_lock.
+    """
+    entry = store.get(key)
+    if entry is None:
+        return None
+    expires, value = entry
+    if expires <= time.monotonic():
+        del store[key]
+        return None
+    return value
+
+
+def _ttl_put(store: dict, key, value) -> None:
+    """Store value under key for CACHE_TTL seconds, evicting if full.
+
+    Callers must hold _response_cache_lock.
+    """
+    now = time.monotonic()
+    if len(store) >= CACHE_MAXSIZE:
+        for stale in [k for k, (exp, _) in store.items() if exp <= now]:
+            del store[stale]
+        if len(store) >= CACHE_MAXSIZE:
+            # Dicts keep insertion order, so this evicts the oldest entry
+            del store[next(iter(store))]
+    store[key] = (now + CACHE_TTL, value)
+
+
+def cache_get(key: tuple) -> Optional[list]:
+    """Return the cached value for key, or None if absent or expired."""
+    with _response_cache_lock:
+        return _ttl_get(_response_cache, key)
+
+
+def cache_put(key: tuple, value: list, generation: int) -> None:
+    """Store value under key for CACHE_TTL seconds.
+
+    Nothing is stored if the key's tool was invalidated since generation
+    was read with cache_generation().
+    """
+    with _response_cache_lock:
+        if _cache_generations.get(key[0], 0) == generation:
+            _ttl_put(_response_cache, key, value)
+
+
+def invalidate_task_listings() -> None:
+    """Drop every cached list_tasks result after a task has been modified.
+
+    Entries are not matched by tasklist_id: the API also accepts aliases
+    such as '@default', so one list can be cached under several IDs, and
+    the cache is small enough to clear outright.  Mutating tools call this
+    in a finally block, since even a failed call may have written (e.g. an
+    earlier batch chunk, or a timed-out PATCH).
+    """
+    with _response_cache_lock:
+        _cache_generations["list_tasks"] = _cache_generations.get("list_tasks", 0) + 1
+        for key in [k for k in _response_cache if k[0] == "list_tasks"]:
+            del _response_cache[key]
+
+
+# ---------------------------------------------------------------------------
+# Per-Task Locks
+# ---------------------------------------------------------------------------
+
+# add_link reads a task's notes and writes them back.  Tool calls interleave
+# at every await, so two concurrent calls on one task could both read the
+# same notes and one link would be lost; they are serialized per task.
+# Entries disappear once no call holds a reference to the lock.
+_task_locks: "weakref.WeakValueDictionary[tuple[str, str], asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def task_lock(tasklist_id: str, task_id: str) -> asyncio.Lock:
+    """Return the lock guarding read-modify-write updates of one task."""
+    key = (tasklist_id, task_id)
+    lock = _task_locks.get(key)
+    if lock is None:
+        lock = asyncio.Lock()
+        _task_locks[key] = lock
+    return lock
 
 
 # ---------------------------------------------------------------------------
@@ -220,16 +756,26 @@ mcp = FastMCP("Google Tasks")
 # Tool: get_lists
 # ---------------------------------------------------------------------------
 @mcp.tool()
-def get_lists() -> list[dict]:
+async def get_lists() -> list[dict]:
     """Get all Google Tasks task lists for the authenticated user.
 
     Returns a list of task lists, each with 'id' and 'title' fields.
     """
+    cache_key = ("get_lists",)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = cache_generation(cache_key)
+
     try:
-        service = get_authenticated_service()
-        results = service.tasklists().list().execute()
+        tasklists = await get_tasklists_resource()
+        results = await execute_request(
+            tasklists.list(fields=TASKLIST_LIST_FIELDS)
+        )
         items = results.get("items", [])
-        return [sanitize_tasklist_response(tl) for tl in items]
+        tasklist_items = [sanitize_tasklist_response(tl) for tl in items]
+        cache_put(cache_key, tasklist_items, generation)
+        return tasklist_items
     except GTasksError:
         raise
     except HttpError as exc:
@@ -242,7 +788,7 @@ def get_lists() -> list[dict]:
 # Tool: create_task
 # ---------------------------------------------------------------------------
 @mcp.tool()
-def create_task(
+async def create_task(
     title: str,
     tasklist_id: str,
     notes: Optional[str] = None,
@@ -261,26 +807,18 @@ def create_task(
     Returns:
         The created task with id, title, notes, due, status, and parent fields.
     """
-    # -- validation --
-    if not title or not title.strip():
-        raise ValidationError("Task title must not be empty.")
-    if len(title) > 1024:
-        raise ValidationError("Task title must be 1024 characters or fewer.")
-    if due_date is not None:
-        validate_date_format(due_date)
-
-    body: dict = {"title": title.strip()}
-    if notes is not None:
-        body["notes"] = notes
-    if due_date is not None:
-        body["due"] = f"{due_date}T00:00:00.000Z"
+    body = build_task_body(title, notes, due_date)
 
     try:
-        service = get_authenticated_service()
-        kwargs: dict = {"tasklist": tasklist_id, "body": body}
+        tasks = await get_tasks_resource()
+        kwargs: dict = {
+            "tasklist": tasklist_id,
+            "body": body,
+            "fields": TASK_FIELDS,
+        }
         if parent is not None:
             kwargs["parent"] = parent
-        result = service.tasks().insert(**kwargs).execute()
+        result = await execute_request(tasks.insert(**kwargs))
         return sanitize_task_response(result)
     except GTasksError:
         raise
@@ -288,13 +826,82 @@ def create_task(
         handle_api_error(exc, "create_task")
     except Exception as exc:
         handle_unexpected_error(exc, "create_task")
+    finally:
+        invalidate_task_listings()
+
+
+# ---------------------------------------------------------------------------
+# Tool: create_tasks
+# ---------------------------------------------------------------------------
+@mcp.tool()
+async def create_tasks(
+    tasklist_id: str,
+    tasks: list[NewTask],
+) -> list[dict]:
+    """Create several tasks in one batched request.
+
+    Args:
+        tasklist_id: ID of the target task list (from get_lists).
+        tasks: Tasks to create. Each entry takes the same fields as
+            create_task: 'title' (required), and optional 'notes',
+            'due_date' (YYYY-MM-DD) and 'parent'. Unknown fields or
+            non-string values reject the whole call.
+
+    Returns:
+        One entry per input task, in order: the created task, or a dict
+        with an 'error' message if that task could not be created.
+        Entries that fail validation (e.g. an empty title or a bad
+        due_date) are reported this way and never sent; the valid ones
+        are still created.
+    """
+    if not tasks:
+        raise ValidationError("At least one task must be provided.")
+
+    results: list[dict] = [{} for _ in tasks]
+    bodies: list[tuple[int, dict]] = []
+    for index, task in enumerate(tasks):
+        try:
+            body = build_task_body(task.title, task.notes, task.due_date)
+        except ValidationError as exc:
+            results[index] = {"error": f"Task {index}: {exc}"}
+        else:
+            bodies.append((index, body))
+
+    if not bodies:
+        return results
+
+    try:
+        service = await get_authenticated_service_async()
+        tasks_resource = await get_tasks_resource()
+        requests = []
+        for index, body in bodies:
+            kwargs: dict = {
+                "tasklist": tasklist_id,
+                "body": body,
+                "fields": TASK_FIELDS,
+            }
+            if tasks[index].parent is not None:
+                kwargs["parent"] = tasks[index].parent
+            requests.append(tasks_resource.insert(**kwargs))
+        created = await execute_batch(service, requests, "create_tasks")
+        for (index, _), result in zip(bodies, created):
+            results[index] = result
+        return results
+    except GTasksError:
+        raise
+    except HttpError as exc:
+        handle_api_error(exc, "create_tasks")
+    except Exception as exc:
+        handle_unexpected_error(exc, "create_tasks")
+    finally:
+        invalidate_task_listings()
 
 
 # ---------------------------------------------------------------------------
 # Tool: list_tasks
 # ---------------------------------------------------------------------------
 @mcp.tool()
-def list_tasks(
+async def list_tasks(
     tasklist_id: str,
     show_completed: bool = False,
     show_hidden: bool = False,
@@ -317,20 +924,27 @@ def list_tasks(
     if max_results > 100:
         max_results = 100
 
+    cache_key = ("list_tasks", tasklist_id, show_completed, show_hidden, max_results)
+    cached = cache_get(cache_key)
+    if cached is not None:
+        return cached
+    generation = cache_generation(cache_key)
+
     try:
-        service = get_authenticated_service()
-        results = (
-            service.tasks()
-            .list(
+        tasks = await get_tasks_resource()
+        results = await execute_request(
+            tasks.list(
                 tasklist=tasklist_id,
                 showCompleted=show_completed,
                 showHidden=show_hidden,
                 maxResults=max_results,
+                fields=TASK_LIST_FIELDS,
             )
-            .execute()
         )
         items = results.get("items", [])
-        return [sanitize_task_response(t) for t in items]
+        task_items = [sanitize_task_response(t) for t in items]
+        cache_put(cache_key, task_items, generation)
+        return task_items
     except GTasksError:
         raise
     except HttpError as exc:
@@ -343,7 +957,7 @@ def list_tasks(
 # Tool: complete_task
 # ---------------------------------------------------------------------------
 @mcp.tool()
-def complete_task(
+async def complete_task(
     tasklist_id: str,
     task_id: str,
     completed: bool,
@@ -359,24 +973,16 @@ def complete_task(
         The updated task with id, title, status, and completed fields.
     """
     try:
-        service = get_authenticated_service()
-
-        # Fetch the current task so we send a full resource to update()
-        current = service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
+        tasks = await get_tasks_resource()
 
-        if completed:
-            current["status"] = "completed"
-            current["completed"] = datetime.now(timezone.utc).strftime(
-                "%Y-%m-%dT%H:%M:%S.000Z"
+        # patch() only sends the mutated fields, so no prior get() is needed.
+        result = await execute_request(
+            tasks.patch(
+                tasklist=tasklist_id,
+                task=task_id,
+                body=build_completion_body(completed),
+                fields=TASK_FIELDS,
             )
-        else:
-            current["status"] = "needsAction"
-            current.pop("completed", None)
-
-        result = (
-            service.tasks()
-            .update(tasklist=tasklist_id, task=task_id, body=current)
-            .execute()
         )
         return sanitize_task_response(result)
     except GTasksError:
@@ -385,13 +991,59 @@ def complete_task(
         handle_api_error(exc, "complete_task")
     except Exception as exc:
         handle_unexpected_error(exc, "complete_task")
+    finally:
+        invalidate_task_listings()
+
+
+# ---------------------------------------------------------------------------
+# Tool: complete_tasks
+# ---------------------------------------------------------------------------
+@mcp.tool()
+async def complete_tasks(
+    tasklist_id: str,
+    task_ids: list[str],
+    completed: bool,
+) -> list[dict]:
+    """Toggle completion status of several tasks in one batched request.
+
+    Args:
+        tasklist_id: ID of the task list containing the tasks.
+        task_ids: IDs of the tasks to update.
+        completed: True to mark as completed, False to mark as needs action.
+
+    Returns:
+        One entry per task ID, in order: the updated task, or a dict with
+        an 'error' message if that task could not be updated.
+    """
+    if not task_ids:
+        raise ValidationError("At least one task ID must be provided.")
+
+    try:
+        service = await get_authenticated_service_async()
+        tasks = await get_tasks_resource()
+        body = build_completion_body(completed)
+        requests = [
+            tasks.patch(
+                tasklist=tasklist_id, task=task_id, body=body, fields=TASK_FIELDS
+            )
+            for task_id in task_ids
+        ]
+        return await execute_batch(service, requests, "complete_tasks")
+    except GTasksError:
+        raise
+    except HttpError as exc:
+        handle_api_error(exc, "complete_tasks")
+    except Exception as exc:
+        handle_unexpected_error(exc, "complete_tasks")
+    finally:
+        invalidate_task_listings()
 
 
 # ---------------------------------------------------------------------------
 # Tool: add_link
 # ---------------------------------------------------------------------------
 @mcp.tool()
-def add_link(
+async def add_link(
     tasklist_id: str,
     task_id: str,
     url: str,
@@ -418,25 +1070,29 @@ def add_link(
     link_entry = f"- [{link_label}]({url})"
 
     try:
-        service = get_authenticated_service()
+        tasks = await get_tasks_resource()
 
-        # Fetch current task to preserve existing notes
-        current = service.tasks().get(tasklist=tasklist_id, task=task_id).execute()
-        current_notes = current.get("notes", "")
-
-        if "Links:" in current_notes:
-            updated_notes = f"{current_notes}\n{link_entry}"
-        else:
-            separator = "\n\n" if current_notes else ""
-            updated_notes = f"{current_notes}{separator}Links:\n{link_entry}"
-
-        current["notes"] = updated_notes
-
-        result = (
-            service.tasks()
-            .update(tasklist=tasklist_id, task=task_id, body=current)
-            .execute()
-        )
+        async with task_lock(tasklist_id, task_id):
+            # Fetch current task to preserve existing notes
+            current = await execute_request(
+                tasks.get(tasklist=tasklist_id, task=task_id, fields="notes")
+            )
+            current_notes = current.get("notes", "")
+
+            if "Links:" in current_notes:
+                updated_notes = f"{current_notes}\n{link_entry}"
+            else:
+                separator = "\n\n" if current_notes else ""
+                updated_notes = f"{current_notes}{separator}Links:\n{link_entry}"
+
+            result = await execute_request(
+                tasks.patch(
+                    tasklist=tasklist_id,
+                    task=task_id,
+                    body={"notes": updated_notes},
+                    fields=TASK_FIELDS,
+                )
+            )
         return sanitize_task_response(result)
     except GTasksError:
         raise
@@ -444,18 +1100,26 @@ def add_link(
         handle_api_error(exc, "add_link")
     except Exception as exc:
         handle_unexpected_error(exc, "add_link")
+    finally:
+        invalidate_task_listings()
 
 
 # ---------------------------------------------------------------------------
 # Entry Point
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
-    import sys
-
-    if len(sys.argv) > 1 and sys.argv[1] == "--auth":
+    parser = argparse.ArgumentParser(description="Google Tasks MCP server.")
+    parser.add_argument(
+        "--auth",
+        action="store_true",
+        help="Run the OAuth consent flow, list task lists, and exit.",
+    )
+    args = parser.parse_args()
+
+    if args.auth:
         print("Authenticating with Google Tasks...")
-        service = get_authenticated_service()
         # Quick smoke test: list task lists
+        service = get_authenticated_service()
         results = service.tasklists().list().execute()
         items = results.get("items", [])
         print(f"Authenticated successfully. Found {len(items)} task list(s):")